@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import Iterable, Optional, Tuple
 
 import build123d as bd
@@ -25,9 +26,8 @@ class B123dAssemblyProtocol(AssemblyProtocol):
     def name(self) -> str:
         return self.o.label
 
-    @property
+    @cached_property
     def color(self) -> Optional[cq.Color]:
-        print(self.o.color)
         if self.o.color:
             return cq.Color(*self.o.color.to_tuple())
 
@@ -36,14 +36,18 @@ class B123dAssemblyProtocol(AssemblyProtocol):
         if isinstance(self.o.wrapped, TopoDS_Solid):
             return cq.Shape(self.o.wrapped)
 
-    @property
-    def children(self) -> Iterable["AssemblyProtocol"]:
+    @cached_property
+    def children(self) -> list["B123dAssemblyProtocol"]:
+        children: list[B123dAssemblyProtocol] = []
         if isinstance(self.o.wrapped, TopoDS_Compound):
             ti = bd.TopoDS_Iterator(self.o.wrapped)
             while ti.More():
-                yield B123dAssemblyProtocol(bd.Shape(ti.Value()), parent=self)
+                children.append(
+                    B123dAssemblyProtocol(bd.Shape(ti.Value()), parent=self)
+                )
                 ti.Next()
         # TODO
+        return children
 
     @property
     def parent(self) -> Optional["AssemblyProtocol"]:
@@ -60,6 +64,13 @@ class B123dAssemblyProtocol(AssemblyProtocol):
             raise ValueError()
 
     def traverse(self) -> Iterable[Tuple[str, "AssemblyProtocol"]]:
-        for ch in self.children:
-            yield from ch.traverse()
-        yield self.name, self
+        # iterative equivalent of yielding from each child's `traverse()` then self;
+        # nodes are pushed back once expanded and only yielded when popped again
+        stack: list[tuple[B123dAssemblyProtocol, bool]] = [(self, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if expanded:
+                yield node.name, node
+            else:
+                stack.append((node, True))
+                stack.extend((child, False) for child in reversed(node.children))
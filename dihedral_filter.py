@@ -1,11 +1,26 @@
 import logging
 from math import pi, radians
-from typing import Callable, Union, cast
-
-from build123d import Compound, Edge, Face, Shape, ShapePredicate, TopAbs_Orientation
+from typing import Callable, ClassVar, Iterable, Optional, Union, cast
+from weakref import WeakKeyDictionary
+
+import numpy as np
+from build123d import (
+    Compound,
+    Edge,
+    Face,
+    Shape,
+    ShapeList,
+    ShapePredicate,
+    TopAbs_Orientation,
+)
+from build123d.topology import HASH_CODE_MAX
+from OCP.TopoDS import TopoDS_Shape
 
 logger = logging.getLogger(__name__)
 
+# edge hash code -> [(edge, (face, face))] for edges shared by exactly 2 faces
+EdgeFaceMap = dict[int, list[tuple[TopoDS_Shape, tuple[Face, Face]]]]
+
 
 def find_ancestor(shape: Shape):
     result = None
@@ -26,6 +41,12 @@ class DiherdralFilter(ShapePredicate):
 
     # we use a class and not a function so we can cache the edge->face maps
 
+    # shared between instances as filters are typically created on the fly
+    # (eg. `.filter_by(DiherdralFilter.Inside())`), weakly keyed by parent shape
+    edge_face_maps: ClassVar[WeakKeyDictionary[Union[Compound, Shape], EdgeFaceMap]] = (
+        WeakKeyDictionary()
+    )
+
     def __init__(
         self,
         angle_predicate: Callable[[float], bool],
@@ -36,7 +57,8 @@ class DiherdralFilter(ShapePredicate):
         self.angle_predicate = angle_predicate
         self.in_degrees = in_degrees
         self.zero_epsilon = zero_epsilon
-        self.edge_face_maps: dict[Union[Compound, Shape], dict[Shape, list[Shape]]] = {}
+        # keyed by `id` of the edges' direct parent, which is kept alive in the value
+        self._ancestor_cache: dict[int, tuple[Shape, Optional[Shape]]] = {}
 
     @classmethod
     def Inside(cls):
@@ -50,24 +72,51 @@ class DiherdralFilter(ShapePredicate):
     def Sharp(cls, threshold: float = 45, *, in_degrees: bool = True):
         return cls(lambda a: 0 < a <= threshold, in_degrees=in_degrees)
 
+    @classmethod
+    def clear_cache(cls):
+        """Forget the cached edge->face maps, eg. after modifying a shape in place"""
+        cls.edge_face_maps.clear()
+
     def _edge_face_map_for_parent(self, parent: Union[Compound, Shape]):
         try:
             return self.edge_face_maps[parent]
         except KeyError:
             logger.debug("computing edge->face map for %s", parent)
-            edge_face_map = parent._entities_from("Edge", "Face")
+            # key by OCCT hash code directly rather than going through `Shape.__hash__`
+            # and `Shape.__eq__`, only keeping the edges that have exactly 2 faces
+            edge_face_map: EdgeFaceMap = {}
+            for e, fs in parent._entities_from("Edge", "Face").items():
+                if len(fs) == 2:
+                    edge_face_map.setdefault(
+                        e.wrapped.HashCode(HASH_CODE_MAX), []
+                    ).append((e.wrapped, (cast(Face, fs[0]), cast(Face, fs[1]))))
             self.edge_face_maps[parent] = edge_face_map
             return edge_face_map
 
+    def _ancestor_for_edge(self, edge: Edge):
+        parent = edge.topo_parent
+        if parent is None:
+            return None
+        try:
+            return self._ancestor_cache[id(parent)][1]
+        except KeyError:
+            ancestor = find_ancestor(edge)
+            self._ancestor_cache[id(parent)] = parent, ancestor
+            return ancestor
+
     def _faces_for_edge(self, edge: Edge):
-        if parent := find_ancestor(edge):
+        if parent := self._ancestor_for_edge(edge):
             edge_to_faces_map = self._edge_face_map_for_parent(parent)
-            fs = edge_to_faces_map.get(edge)
-            if fs and len(fs) == 2:
-                return cast(Face, fs[0]), cast(Face, fs[1])
+            wrapped = edge.wrapped
+            for e, faces in edge_to_faces_map.get(wrapped.HashCode(HASH_CODE_MAX), ()):
+                if e.IsSame(wrapped):
+                    return faces
         raise KeyError(edge)
 
     def __call__(self, edge: Edge):
+        angle_predicate = self.angle_predicate
+        in_degrees = self.in_degrees
+        zero_epsilon = self.zero_epsilon
         try:
             f1, f2 = self._faces_for_edge(edge)
 
@@ -88,9 +137,68 @@ class DiherdralFilter(ShapePredicate):
             elif angle < 0:
                 angle = -pi - angle
 
-            if not (self.zero_epsilon <= abs(angle) <= pi - self.zero_epsilon):
+            if not (zero_epsilon <= abs(angle) <= pi - zero_epsilon):
                 angle = 0
 
-            return self.angle_predicate(radians(angle) if self.in_degrees else angle)
+            return angle_predicate(radians(angle) if in_degrees else angle)
         except KeyError:
             return False
+
+    def filter_edges(self, edges: Iterable[Edge]) -> ShapeList[Edge]:
+        """Same as `.filter_by(self)` but computes all the angles at once"""
+        edges = list(edges)
+        n = len(edges)
+        v1s = np.empty((n, 3))
+        v2s = np.empty((n, 3))
+        refs = np.empty((n, 3))
+        reversed_flags = np.zeros(n, dtype=bool)
+
+        candidates: list[Edge] = []
+        for edge in edges:
+            try:
+                f1, f2 = self._faces_for_edge(edge)
+            except KeyError:
+                continue
+            k = len(candidates)
+            candidates.append(edge)
+
+            p = edge.center()
+            v1 = f1.normal_at(p).wrapped
+            v2 = f2.normal_at(p).wrapped
+            ref = edge.tangent_at(0).wrapped
+            v1s[k] = v1.X(), v1.Y(), v1.Z()
+            v2s[k] = v2.X(), v2.Y(), v2.Z()
+            refs[k] = ref.X(), ref.Y(), ref.Z()
+            reversed_flags[k] = (
+                edge.wrapped.Orientation() == TopAbs_Orientation.TopAbs_REVERSED
+            )
+
+        n = len(candidates)
+        v1s, v2s, refs, reversed_flags = v1s[:n], v2s[:n], refs[:n], reversed_flags[:n]
+
+        # same as `v2.AngleWithRef(v1, ref)`
+        cross = np.cross(v2s, v1s)
+        sin = np.linalg.norm(cross, axis=1)
+        cos = np.einsum("ij,ij->i", v2s, v1s)
+        angles = np.arctan2(sin, cos)
+        angles = np.where(np.einsum("ij,ij->i", cross, refs) >= 0, angles, -angles)
+
+        angles = np.where(reversed_flags, -angles, angles)
+        angles = np.where(
+            angles > 0, pi - angles, np.where(angles < 0, -pi - angles, angles)
+        )
+        abs_angles = np.abs(angles)
+        angles = np.where(
+            (self.zero_epsilon <= abs_angles) & (abs_angles <= pi - self.zero_epsilon),
+            angles,
+            0.0,
+        )
+        if self.in_degrees:
+            angles = np.radians(angles)
+
+        angle_predicate = self.angle_predicate
+        return ShapeList(
+            edge
+            for edge, angle in zip(candidates, angles.tolist())
+            if angle_predicate(angle)
+        )
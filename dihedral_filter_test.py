@@ -0,0 +1,22 @@
+import unittest
+
+from build123d.topology import Solid
+
+from dihedral_filter import DiherdralFilter
+
+
+class TestDihedralFilter(unittest.TestCase):
+    def test_filter_edges_same_as_filter_by(self):
+        box = Solid.make_box(2, 2, 2)
+        shape = box.fuse(box.translate((1, 1, 0))).clean()
+        shape = shape.fuse(Solid.make_cylinder(0.5, 3).translate((0.5, 0.5, 0))).clean()
+        edges = shape.edges()
+
+        for f in (
+            DiherdralFilter.Inside(),
+            DiherdralFilter.Outside(),
+            DiherdralFilter.Sharp(2),
+        ):
+            expected = edges.filter_by(f)
+            self.assertTrue(expected)
+            self.assertEqual(f.filter_edges(edges), expected)
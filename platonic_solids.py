@@ -1,52 +1,75 @@
 import re
-from itertools import chain, product
-from typing import Iterable
+from itertools import product
+from math import atan2
+from typing import Iterable, Sequence
 
+import numpy as np
 from build123d import Align, Face, Shell, Solid, Text, Vector, VectorLike, Wire
-from pyhull.convex_hull import ConvexHull
+from scipy.spatial import ConvexHull
 
 
 def convexhull_of_points(points: Iterable[VectorLike]):
     vectors = [Vector(point) for point in points]
-    faces = ConvexHull([v.to_tuple() for v in vectors]).vertices
+    hull = ConvexHull(np.array([v.to_tuple() for v in vectors]))
+
+    # qhull's facets are triangulated, merge coplanar triangles back into polygons
+    facets: dict[tuple[float, ...], set[int]] = {}
+    for simplex, equation in zip(hull.simplices, hull.equations):
+        facets.setdefault(tuple(equation.round(9)), set()).update(simplex.tolist())
+
+    def ordered(face: set[int], normal: Vector):
+        """sort (convex) polygon indices counter-clockwise around the normal"""
+        center = sum((vectors[i] for i in face), Vector()) / len(face)
+        u = vectors[min(face)] - center
+        v = normal.cross(u)
+
+        def angle(i: int):
+            d = vectors[i] - center
+            return atan2(d.dot(v), d.dot(u))
+
+        return sorted(face, key=angle)
+
     return Solid.make_solid(
         Shell.make_shell(
-            Face.make_from_wires(Wire.make_polygon(vectors[i] for i in face))
-            for face in faces
+            Face.make_from_wires(
+                Wire.make_polygon(
+                    vectors[i] for i in ordered(face, Vector(*equation[:3]))
+                )
+            )
+            for equation, face in facets.items()
         )
     )
 
 
-def expand_coords(coords: tuple[str, str, str]) -> Iterable[tuple[float, float, float]]:
+PHI = (1 + 5**0.5) / 2
+CONSTANTS = {
+    "φ": PHI,
+    "1/φ": 2 / (1 + 5**0.5),
+}
+COORDS_RE = re.compile(r"\(([^)]+)\)")
+
+
+def expand_coords(coords: Sequence[str]) -> list[tuple[float, float, float]]:
     """`('1', '±2', '3')` -> `[(1, -2, 3), (1, 2, 3)]`"""
-    CONSTANTS = {
-        "φ": (1 + 5**0.5) / 2,
-        "1/φ": 2 / (1 + 5**0.5),
-    }
 
     def parse_v(s: str) -> float:
         return float(CONSTANTS.get(s, s))
 
-    def expand_plusminus(s: str):
-        s = s.strip()
-        if s[0] == "±":
-            v = parse_v(s[1:])
-            yield +v
-            yield -v
-        else:
-            yield parse_v(s)
-
-    return product(*map(expand_plusminus, coords))
+    coords = [s.strip() for s in coords]
+    values = np.array([parse_v(s.lstrip("±")) for s in coords])
+    signs = np.array(
+        list(product(*((1, -1) if s.startswith("±") else (1,) for s in coords)))
+    )
+    return list(map(tuple, (signs * values).tolist()))
 
 
-def parse_coords(coords: str) -> Iterable[tuple[float, float, float]]:
+def parse_coords(coords: str) -> list[tuple[float, float, float]]:
     """`"(1, ±2, 3) (±4, 5, 6)"` -> `[(1, -2, 3), (1, 2, 3), (-4, 5, 6), (4, 5 ,6)]`"""
-    return chain.from_iterable(
-        map(
-            expand_coords,
-            (xyz.split(",") for xyz in re.findall(r"\(([^)]+)\)", coords)),
-        )
-    )
+    return [
+        xyz
+        for coords_str in COORDS_RE.findall(coords)
+        for xyz in expand_coords(coords_str.split(","))
+    ]
 
 
 platonic_solids = {
@@ -1,15 +1,30 @@
 import logging
 import pathlib
-from collections import defaultdict
+from functools import lru_cache
 from itertools import chain
-from typing import Iterable, Optional, TextIO, Union, cast
+from math import cos, pi, radians, sin
+from typing import Hashable, Iterable, Optional, TextIO, Union, cast
 
+import numpy as np
 import svgelements
-from svgpathtools import Arc, CubicBezier, Line, Path, QuadraticBezier
-
-from build123d.build_enums import AngularDirection
-from build123d.geometry import Axis, Color, Plane
-from build123d.topology import RAD2DEG, Edge, Face, Wire
+from OCP.BRep import BRep_Tool
+from OCP.BRepBuilderAPI import BRepBuilderAPI_Copy, BRepBuilderAPI_MakeEdge
+from OCP.Geom import Geom_BezierCurve
+from OCP.GC import GC_MakeArcOfEllipse
+from OCP.gp import gp_Ax2, gp_Dir, gp_Elips, gp_Pnt
+from OCP.TColgp import TColgp_Array1OfPnt
+from OCP.TopExp import TopExp
+from OCP.TopoDS import TopoDS_Edge, TopoDS_Shape
+from svgpathtools import (
+    Arc,
+    CubicBezier,
+    Line,
+    Path,
+    QuadraticBezier,
+)
+
+from build123d.geometry import Color, Plane
+from build123d.topology import Compound, Edge, Face, Shape, Wire
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +32,8 @@ INKSCAPE_LABEL = "{http://www.inkscape.org/namespaces/inkscape}label"
 
 SvgPathLike = Union[str, Path]
 
+_CLOSE_TOLERANCE = 1e-9
+
 
 def import_svg_document(
     svg_file: Union[str, pathlib.Path, TextIO],
@@ -52,10 +69,53 @@ def import_svg_document(
     """
 
     def _path_to_svgpathtools(svgelements_path: svgelements.Path):
-        """converting segments might be faster than re-parsing maybe?
-        but the representations are different (segments vs commands)
-        so exchanging via string is probably a safer bet."""
-        return Path(str(svgelements_path))
+        """convert segments directly rather than going through a string,
+        which would have to be tokenized and parsed again"""
+        path = Path()
+        for segment in svgelements_path.segments():
+            if isinstance(segment, svgelements.Move):
+                continue
+            start = complex(segment.start)
+            end = complex(segment.end)
+            if isinstance(segment, svgelements.Close):
+                # a closing gap that is only rounding noise (eg. in shapes converted
+                # to arcs) is removed by moving the end of the last segment instead,
+                # a tiny closing line would make a degenerate edge
+                if abs(end - start) >= _CLOSE_TOLERANCE:
+                    path.append(Line(start, end))
+                elif start != end and path and path[-1].end == start:
+                    path[-1] = _with_end(path[-1], end)
+            elif isinstance(segment, svgelements.Line):
+                path.append(Line(start, end))
+            elif isinstance(segment, svgelements.QuadraticBezier):
+                path.append(QuadraticBezier(start, complex(segment.control), end))
+            elif isinstance(segment, svgelements.CubicBezier):
+                path.append(
+                    CubicBezier(
+                        start,
+                        complex(segment.control1),
+                        complex(segment.control2),
+                        end,
+                    )
+                )
+            elif isinstance(segment, svgelements.Arc):
+                # degenerate arcs are omitted or drawn as lines (SVG spec F.6.2)
+                if abs(end - start) < _CLOSE_TOLERANCE:
+                    continue
+                if not segment.rx or not segment.ry:
+                    path.append(Line(start, end))
+                    continue
+                path.append(
+                    Arc(
+                        start,
+                        complex(segment.rx, segment.ry),
+                        segment.get_rotation().as_degrees,
+                        abs(segment.sweep) > pi,
+                        segment.sweep >= 0,
+                        end,
+                    )
+                )
+        return path
 
     def _path_to_faces_or_wires(svgelements_path: svgelements.Path):
         path = _path_to_svgpathtools(svgelements_path)
@@ -76,9 +136,23 @@ def import_svg_document(
             except (KeyError, AttributeError):
                 pass
 
+        if mirror:
+            # mirror all the shapes at once rather than one by one,
+            # mirroring a compound reverses its children so restore their orientation
+            faces_or_wires = list(faces_or_wires)
+            if faces_or_wires:
+                mirrored = Compound.make_compound(faces_or_wires).mirror(Plane.XZ)
+                faces_or_wires = [
+                    cast(
+                        Union[Face, Wire],
+                        Shape.cast(
+                            mirrored_shape.wrapped.Oriented(shape.wrapped.Orientation())
+                        ),
+                    )
+                    for shape, mirrored_shape in zip(faces_or_wires, mirrored)
+                ]
+
         for face_or_wire in faces_or_wires:
-            if mirror:
-                face_or_wire = cast(Union[Face, Wire], face_or_wire.mirror(Plane.XZ))
             if label:
                 face_or_wire.label = label
             if color:
@@ -117,6 +191,8 @@ def import_svg_document(
 def faces_from_svg_path(path: SvgPathLike):
     """Convert an SVG path to faces.
 
+    Shapes are cached by path (string or segments), each call returns new copies of them.
+
     Args:
         path: svg path to convert
 
@@ -127,10 +203,82 @@ def faces_from_svg_path(path: SvgPathLike):
     Yields:
         face
     """
-    path = path_from_SvgPathLike(path)
+    if _is_empty(path):
+        return
+    yield from _copied(_cached_shapes_from_svg_path(_cache_key(path), filled=True))
 
-    subpaths: list[Path] = path.continuous_subpaths()
-    for subpath in subpaths:
+
+def wires_from_svg_path(path: SvgPathLike):
+    """Convert an SVG path to wires.
+
+    Shapes are cached by path (string or segments), each call returns new copies of them.
+
+    Args:
+        path: svg path to convert
+
+    Raises:
+        SyntaxError:
+
+    Yields:
+        wire
+    """
+    if _is_empty(path):
+        return
+    yield from _copied(_cached_shapes_from_svg_path(_cache_key(path), filled=False))
+
+
+def _cache_key(path: SvgPathLike) -> Hashable:
+    # strings are their own key (saving a parse on hits), `Path` objects are keyed
+    # by their segments' types and constructor arguments so they can be rebuilt
+    if isinstance(path, str):
+        return path
+    return tuple((type(segment), *_segment_args(segment)) for segment in path)
+
+
+def _segment_args(segment: Union[Line, QuadraticBezier, CubicBezier, Arc]) -> tuple:
+    if isinstance(segment, Line):
+        return (segment.start, segment.end)
+    elif isinstance(segment, QuadraticBezier):
+        return (segment.start, segment.control, segment.end)
+    elif isinstance(segment, CubicBezier):
+        return (segment.start, segment.control1, segment.control2, segment.end)
+    elif isinstance(segment, Arc):
+        return (
+            segment.start,
+            segment.radius,
+            segment.rotation,
+            segment.large_arc,
+            segment.sweep,
+            segment.end,
+        )
+    else:
+        raise ValueError(f"unsupported segment type: {type(segment).__name__}")
+
+
+@lru_cache(maxsize=1024)
+def _cached_shapes_from_svg_path(
+    key: Hashable, filled: bool
+) -> tuple[TopoDS_Shape, ...]:
+    # documents and drawings often repeat the same paths (icons, glyphs, patterns...)
+    # so keep the resulting shapes around, to be copied before being handed out
+    if isinstance(key, str):
+        svg_path = path_from_SvgPathLike(key)
+    else:
+        svg_path = Path(*(cls(*args) for cls, *args in cast(tuple, key)))
+    if filled:
+        shapes: Iterable[Shape] = _faces_from_svg_path(svg_path)
+    else:
+        shapes = _wires_from_svg_path(svg_path)
+    return tuple(shape.wrapped for shape in shapes)
+
+
+def _copied(shapes: Iterable[TopoDS_Shape]):
+    for shape in shapes:
+        yield cast(Union[Face, Wire], Shape.cast(BRepBuilderAPI_Copy(shape).Shape()))
+
+
+def _faces_from_svg_path(path: Path):
+    def closed(subpath: Path):
         try:
             subpath.closed = True
         except ValueError:  # not closeable
@@ -139,9 +287,11 @@ def faces_from_svg_path(path: SvgPathLike):
                 subpath.closed = True
             except ValueError:  # still not closeable
                 raise ValueError("could ensure path is closed")
+        return subpath
 
-    for exterior, interiors in unnest_paths(*subpaths):
-        outer_wires = list(wires_from_svg_path(exterior))
+    subpaths = [closed(subpath) for subpath in path.continuous_subpaths()]
+    for exterior, interiors in unnest_paths_decomposed(subpaths):
+        outer_wires = list(_wires_from_svg_path(exterior))
         if outer_wires:
             outer_wire, *extra_outer_wires = outer_wires
             inner_wires = [
@@ -155,20 +305,7 @@ def faces_from_svg_path(path: SvgPathLike):
                 yield Face.make_from_wires(outer_wire, inner_wires)
 
 
-def wires_from_svg_path(path: SvgPathLike):
-    """Convert an SVG path to wires.
-
-    Args:
-        path: svg path to convert
-
-    Raises:
-        SyntaxError:
-
-    Yields:
-        wire
-    """
-
-    path = path_from_SvgPathLike(path)
+def _wires_from_svg_path(path: Path):
     subpaths: list[Path] = path.continuous_subpaths()
     for subpath in subpaths:
         if subpath:
@@ -187,43 +324,86 @@ def edges_from_svg_path(path: SvgPathLike):
     Yields:
         edge
     """
+    if _is_empty(path):
+        return
 
     path = path_from_SvgPathLike(path)
+    for segment in path:
+        yield edge_from_svg_segment(segment)
+
+
+def edge_from_svg_segment(segment: Union[Line, QuadraticBezier, CubicBezier, Arc]):
+    """Convert an SVG path segment to an edge."""
+
+    # segments are built with OCCT directly (and only wrapped once) rather than with
+    # `Edge.make_line`, `Edge.make_bezier` and `Edge.make_ellipse`, which go through
+    # `Vector` conversions and argument checks we know we don't need here
+    if isinstance(segment, Line):
+        return Edge(_make_line(segment.start, segment.end))
+    elif isinstance(segment, QuadraticBezier):
+        return Edge(_make_bezier(segment.start, segment.control, segment.end))
+    elif isinstance(segment, CubicBezier):
+        return Edge(
+            _make_bezier(segment.start, segment.control1, segment.control2, segment.end)
+        )
+    elif isinstance(segment, Arc):
+        return Edge(_make_arc(segment))
+    else:
+        raise ValueError(f"unsupported segment type: {type(segment).__name__}")
 
-    def v(c: complex):
-        return c.real, c.imag
 
-    for segment in path:
-        if isinstance(segment, Line):
-            yield Edge.make_line(v(segment.start), v(segment.end))
-        elif isinstance(segment, QuadraticBezier):
-            yield Edge.make_bezier(v(segment.start), v(segment.control), v(segment.end))
-        elif isinstance(segment, CubicBezier):
-            yield Edge.make_bezier(
-                v(segment.start),
-                v(segment.control1),
-                v(segment.control2),
-                v(segment.end),
-            )
-        elif isinstance(segment, Arc):
-            if segment.sweep:
-                angular_direction = AngularDirection.COUNTER_CLOCKWISE
-            else:
-                angular_direction = AngularDirection.CLOCKWISE
-
-            plane = Plane.XY
-            plane.origin = v(segment.center)
-            start_angle = segment.theta
-            end_angle = segment.theta + segment.delta
-            ellipse = Edge.make_ellipse(
-                x_radius=segment.radius.real,
-                y_radius=segment.radius.imag,
-                plane=plane,
-                start_angle=min(start_angle, end_angle),
-                end_angle=max(start_angle, end_angle),
-                angular_direction=angular_direction,
-            ).rotate(Axis(plane.origin, plane.z_dir.to_tuple()), segment.phi * RAD2DEG)
-            yield cast(Edge, ellipse)
+def _with_end(segment: Union[Line, QuadraticBezier, CubicBezier, Arc], end: complex):
+    if isinstance(segment, Line):
+        return Line(segment.start, end)
+    elif isinstance(segment, QuadraticBezier):
+        return QuadraticBezier(segment.start, segment.control, end)
+    elif isinstance(segment, CubicBezier):
+        return CubicBezier(segment.start, segment.control1, segment.control2, end)
+    else:
+        return Arc(
+            segment.start,
+            segment.radius,
+            segment.rotation,
+            segment.large_arc,
+            segment.sweep,
+            end,
+        )
+
+
+def _pnt(c: complex):
+    return gp_Pnt(c.real, c.imag, 0)
+
+
+def _make_line(start: complex, end: complex) -> TopoDS_Edge:
+    return BRepBuilderAPI_MakeEdge(_pnt(start), _pnt(end)).Edge()
+
+
+def _make_bezier(*points: complex) -> TopoDS_Edge:
+    poles = TColgp_Array1OfPnt(1, len(points))
+    for i, point in enumerate(points, start=1):
+        poles.SetValue(i, _pnt(point))
+    return BRepBuilderAPI_MakeEdge(Geom_BezierCurve(poles)).Edge()
+
+
+def _make_arc(arc: Arc) -> TopoDS_Edge:
+    # the ellipse's frame is rotated from the start,
+    # rather than rotating the resulting edge afterwards
+    x_radius, y_radius = arc.radius.real, arc.radius.imag
+    phi = arc.phi
+    start_angle = radians(min(arc.theta, arc.theta + arc.delta))
+    end_angle = radians(max(arc.theta, arc.theta + arc.delta))
+    if y_radius > x_radius:
+        # OCCT needs the major radius along the frame's x direction
+        x_radius, y_radius = y_radius, x_radius
+        phi += pi / 2
+        start_angle -= pi / 2
+        end_angle -= pi / 2
+
+    frame = gp_Ax2(_pnt(arc.center), gp_Dir(0, 0, 1), gp_Dir(cos(phi), sin(phi), 0))
+    ellipse = GC_MakeArcOfEllipse(
+        gp_Elips(frame, x_radius, y_radius), start_angle, end_angle, arc.sweep
+    ).Value()
+    return BRepBuilderAPI_MakeEdge(ellipse).Edge()
 
 
 def known_continuous_edges_to_wire(edges: Iterable[Edge]):
@@ -235,17 +415,21 @@ def known_continuous_edges_to_wire(edges: Iterable[Edge]):
 
 def fill_gaps_between_edges(edges: Iterable[Edge], tolerance: float):
     """Insert line segments between edges that are more that `tolerance` apart"""
+    # compare squared distances between the edges' vertices' points
+    # to avoid going through `Vector`s for every edge
+    squared_tolerance = tolerance * tolerance
     it = filter(Edge.is_valid, edges)
     try:
         edge = next(it)
         yield edge
-        end = edge.end_point()
+        end = BRep_Tool.Pnt_s(TopExp.LastVertex_s(edge.wrapped))
         while True:
             edge = next(it)
-            if abs(edge.start_point() - end) > tolerance:
-                yield Edge.make_line(end, edge.start_point())
+            start = BRep_Tool.Pnt_s(TopExp.FirstVertex_s(edge.wrapped))
+            if end.SquareDistance(start) > squared_tolerance:
+                yield Edge(BRepBuilderAPI_MakeEdge(end, start).Edge())
             yield edge
-            end = edge.end_point()
+            end = BRep_Tool.Pnt_s(TopExp.LastVertex_s(edge.wrapped))
     except StopIteration:
         pass
 
@@ -254,27 +438,90 @@ def unnest_paths(
     *paths: Path,
 ) -> Iterable[tuple[Path, list[Path]]]:
     """sort non-intersecting paths into pairs of singly-nested exterior and interiors"""
-    continuous_paths: list[Path] = list(
-        chain.from_iterable(path.continuous_subpaths() for path in paths)
+    return unnest_paths_decomposed(
+        list(chain.from_iterable(path.continuous_subpaths() for path in paths))
     )
 
-    included_in: dict[int, set[int]] = defaultdict(set)
+
+def unnest_paths_decomposed(
+    continuous_paths: list[Path],
+) -> Iterable[tuple[Path, list[Path]]]:
+    """same as `unnest_paths` for paths already split into continuous subpaths"""
     n = len(continuous_paths)
+    polylines = [
+        _polyline_from_path(path) if path else None for path in continuous_paths
+    ]
+
+    # the closest edge above the leftmost vertex of a path belongs either to its parent
+    # (ie. the smallest path that contains it) if the vertex is on its interior side,
+    # or to a path sharing the same parent otherwise
+    closest_above = _closest_edges_above_leftmost_vertices(polylines)
+
+    def smallest_container(i: int):
+        inner = polylines[i]
+        if inner is None:
+            return None
+        containers = [
+            j
+            for j, outer in enumerate(polylines)
+            if j != i and outer is not None and _polyline_inside(inner, outer)
+        ]
+        return min(
+            containers,
+            key=lambda j: abs(_polyline_signed_area(polylines[j])),
+            default=None,
+        )
+
+    parents: dict[int, Optional[int]] = {}
     for i in range(n):
-        for j in range(n):
-            if i != j and continuous_paths[i].is_contained_by(continuous_paths[j]):
-                included_in[i].add(j)
+        pending: list[int] = []
+        k = i
+        while k not in parents:
+            pending.append(k)
+            above = closest_above[k]
+            if above is None:
+                parents[k] = None
+            else:
+                j, inside = above
+                if inside is None:
+                    # touching paths, the closest edge tells nothing
+                    parents[k] = smallest_container(k)
+                elif inside:
+                    parents[k] = j
+                elif j in pending:
+                    # touching or intersecting paths, do not follow the loop
+                    parents[k] = smallest_container(k)
+                else:
+                    k = j
+        parent = parents[k]
+        for sibling in pending:
+            if parent in pending:
+                # the sweep misjudged touching paths into a loop,
+                # fall back to containment tests rather than creating a cycle
+                parents[sibling] = smallest_container(sibling)
+            else:
+                parents[sibling] = parent
 
-    PathListPair = tuple[list[Path], list[Path]]
-    exterior_and_interiors: dict[int, PathListPair] = defaultdict(lambda: ([], []))
+    depths: dict[int, int] = {}
     for i in range(n):
-        ancestors = included_in[i]
-        depth = len(ancestors)
-        if depth % 2:
-            parent_i = max(ancestors, key=lambda i: len(included_in[i]))
-            exterior_and_interiors[parent_i][1].append(continuous_paths[i])
+        pending = []
+        parent: Optional[int] = i
+        while parent is not None and parent not in depths:
+            pending.append(parent)
+            parent = parents[parent]
+        depth = -1 if parent is None else depths[parent]
+        for k in reversed(pending):
+            depth += 1
+            depths[k] = depth
+
+    PathListPair = tuple[list[Path], list[Path]]
+    exterior_and_interiors: dict[int, PathListPair] = {}
+    for i, path in enumerate(continuous_paths):
+        parent = parents[i]
+        if parent is not None and depths[i] % 2:
+            exterior_and_interiors.setdefault(parent, ([], []))[1].append(path)
         else:
-            exterior_and_interiors[i][0].append(continuous_paths[i])
+            exterior_and_interiors.setdefault(i, ([], []))[0].append(path)
 
     for exteriors, interiors in exterior_and_interiors.values():
         if len(exteriors) == 1:
@@ -287,6 +534,222 @@ def unnest_paths(
                 yield path, []
 
 
+def _closest_edges_above_leftmost_vertices(
+    polylines: list[Optional[np.ndarray]],
+) -> list[Optional[tuple[int, Optional[bool]]]]:
+    """for each closed polyline, find the closest edge of another polyline
+    directly above (ie. towards +y) its leftmost vertex, as the index of that
+    other polyline and whether the vertex is on the interior side of the edge
+    (`None` if that cannot be told from the edge, ie. when the vertex is on the edge
+    or the edge starts on the same vertical as the vertex).
+
+    Sweep-line over the edges sorted by x, keeping the edges crossing the sweep
+    line sorted by y, as described in Bajaj & Dey, "Polygon nesting and robustness".
+    Polylines are assumed not to intersect each other.
+    """
+    owners = []
+    lefts = []
+    rights = []
+    interior_belows = []
+    queries = []
+    for i, polyline in enumerate(polylines):
+        if polyline is None:
+            continue
+        a, b = polyline[:-1], polyline[1:]
+        # positive signed area means the interior is on the left of the edges
+        ccw = np.sum(a.real * b.imag - b.real * a.imag) > 0
+        non_vertical = a.real != b.real
+        a, b = a[non_vertical], b[non_vertical]
+        flipped = b.real < a.real
+        lefts.append(np.where(flipped, b, a))
+        rights.append(np.where(flipped, a, b))
+        interior_belows.append(flipped == ccw)
+        owners.append(np.full(len(a), i))
+        queries.append((i, polyline[np.argmin(polyline.real)]))
+
+    result: list[Optional[tuple[int, Optional[bool]]]] = [None] * len(polylines)
+    if not queries:
+        return result
+
+    left = np.concatenate(lefts)
+    right = np.concatenate(rights)
+    edge_count = len(left)
+    slope = (right.imag - left.imag) / (right.real - left.real)
+
+    # events: edge removals, then edge insertions, then queries for the same x
+    event_xs = np.concatenate(
+        [right.real, left.real, [vertex.real for _i, vertex in queries]]
+    )
+    event_kinds = np.repeat([0, 1, 2], [edge_count, edge_count, len(queries)])
+    event_indices = np.concatenate(
+        [np.arange(edge_count), np.arange(edge_count), np.arange(len(queries))]
+    )
+    order = np.lexsort((event_kinds, event_xs))
+
+    xs = left.real.tolist()
+    ys = left.imag.tolist()
+    slopes = slope.tolist()
+    owner = np.concatenate(owners).tolist()
+    interior_below = np.concatenate(interior_belows).tolist()
+
+    active: list[int] = []
+
+    def bisect_active(x: float, y: float, s: float):
+        # edges crossing the sweep line do not intersect so their order is stable,
+        # edges meeting at the same point are ordered by slope
+        lo, hi = 0, len(active)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            e = active[mid]
+            y_e = ys[e] + (x - xs[e]) * slopes[e]
+            if y_e < y or (y_e == y and slopes[e] <= s):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    for kind, index in zip(event_kinds[order].tolist(), event_indices[order].tolist()):
+        if kind == 0:
+            active.remove(index)
+        elif kind == 1:
+            active.insert(bisect_active(xs[index], ys[index], slopes[index]), index)
+        else:
+            i, vertex = queries[index]
+            x, y = vertex.real, vertex.imag
+            tolerance = 1e-9 * max(1.0, abs(y))
+            x_tolerance = 1e-9 * max(1.0, abs(x))
+            above = active[bisect_active(x, y - tolerance, float("-inf")) :]
+            for n, e in enumerate(above):
+                if owner[e] == i:
+                    continue
+                y_e = ys[e] + (x - xs[e]) * slopes[e]
+                # cannot tell which side of the edge the vertex is on if it is
+                # on the edge, or if the edge's path starts on the same vertical as
+                # the vertex (and may be inside its path), or if another path has
+                # an edge at the same place (and may be the actual closest one)
+                ambiguous = y_e <= y + tolerance or xs[e] >= x - x_tolerance
+                for f in above[n + 1 :]:
+                    if ambiguous or ys[f] + (x - xs[f]) * slopes[f] > y_e + tolerance:
+                        break
+                    ambiguous = owner[f] not in (i, owner[e])
+                result[i] = owner[e], None if ambiguous else interior_below[e]
+                break
+    return result
+
+
+POLYLINE_SAMPLES_PER_CURVE = 32
+
+
+def _sample_segments(
+    segments: list[Union[Line, QuadraticBezier, CubicBezier, Arc]], t: np.ndarray
+):
+    """points of same-type `segments` at parameters `t`,
+    as an array of complex numbers of shape `(len(segments), len(t))`"""
+    first = segments[0]
+    t = t[np.newaxis, :]
+    if isinstance(first, Line):
+        p0, p1 = np.array([s.bpoints() for s in segments]).T[..., np.newaxis]
+        return p0 + t * (p1 - p0)
+    elif isinstance(first, QuadraticBezier):
+        p0, p1, p2 = np.array([s.bpoints() for s in segments]).T[..., np.newaxis]
+        u = 1 - t
+        return u * u * p0 + 2 * u * t * p1 + t * t * p2
+    elif isinstance(first, CubicBezier):
+        p0, p1, p2, p3 = np.array([s.bpoints() for s in segments]).T[..., np.newaxis]
+        u = 1 - t
+        return u * u * u * p0 + 3 * u * u * t * p1 + 3 * u * t * t * p2 + t * t * t * p3
+    elif isinstance(first, Arc):
+        # center parameterization (SVG implementation notes F.6.3)
+        center, rotation, radius, theta, delta = np.array(
+            [(s.center, s.rot_matrix, s.radius, s.theta, s.delta) for s in segments]
+        ).T[..., np.newaxis]
+        angle = np.radians(theta.real + t * delta.real)
+        return center + rotation * (
+            radius.real * np.cos(angle) + 1j * radius.imag * np.sin(angle)
+        )
+    else:
+        raise ValueError(f"unknown segment type: {type(first)}")
+
+
+def _polyline_from_path(
+    path: Path, samples_per_curve: int = POLYLINE_SAMPLES_PER_CURVE
+):
+    """vertices of a closed polyline approximating `path`, as an array of complex numbers"""
+    # sample all the segments of a given type at once
+    # rather than paying for numpy calls on each (typically short) segment
+    indices_by_type: dict[type, list[int]] = {}
+    for i, segment in enumerate(path):
+        indices_by_type.setdefault(type(segment), []).append(i)
+
+    curve_t = np.linspace(0, 1, samples_per_curve, endpoint=False)
+    line_t = np.zeros(1)
+    counts = np.full(len(path), samples_per_curve)
+    counts[indices_by_type.get(Line, [])] = 1
+    offsets = np.concatenate([[0], np.cumsum(counts)])
+
+    polyline = np.empty(offsets[-1] + 2, dtype=complex)
+    for segment_type, indices in indices_by_type.items():
+        t = line_t if segment_type is Line else curve_t
+        points = _sample_segments([path[i] for i in indices], t)
+        polyline[offsets[indices][:, np.newaxis] + np.arange(len(t))] = points
+    polyline[-2:] = path.end, path.start
+    return polyline
+
+
+def _winding_number(pt: complex, polyline: np.ndarray) -> int:
+    """winding number of the closed `polyline` around `pt` (Sunday's crossing test)"""
+    x, y = pt.real, pt.imag
+    a, b = polyline[:-1], polyline[1:]
+    side = (b.real - a.real) * (y - a.imag) - (x - a.real) * (b.imag - a.imag)
+    below_a = a.imag <= y
+    below_b = b.imag <= y
+    upward = below_a & ~below_b & (side > 0)
+    downward = ~below_a & below_b & (side < 0)
+    return int(np.count_nonzero(upward)) - int(np.count_nonzero(downward))
+
+
+def _polyline_signed_area(polyline: np.ndarray) -> float:
+    a, b = polyline[:-1], polyline[1:]
+    return float(np.sum(a.real * b.imag - b.real * a.imag)) / 2
+
+
+def _polyline_inside(inner: np.ndarray, outer: np.ndarray) -> bool:
+    """whether the closed polyline `inner` is inside the closed polyline `outer`,
+    assuming they do not cross (they may touch)"""
+    if (
+        inner.real.min() < outer.real.min()
+        or inner.real.max() > outer.real.max()
+        or inner.imag.min() < outer.imag.min()
+        or inner.imag.max() > outer.imag.max()
+    ):
+        return False
+
+    # test the first vertex (or edge midpoint) of `inner`
+    # that is not on the boundary of `outer`
+    a, b = outer[:-1], outer[1:]
+    d = b - a
+    squared_lengths = d.real * d.real + d.imag * d.imag
+    tolerance = 1e-9 * max(1.0, float(np.abs(outer).max()))
+    midpoints = (inner[:-1] + inner[1:]) / 2
+    for pt in chain(inner.tolist(), midpoints.tolist()):
+        t = ((pt - a) * d.conjugate()).real
+        t = np.clip(
+            np.divide(
+                t, squared_lengths, out=np.zeros_like(t), where=squared_lengths > 0
+            ),
+            0,
+            1,
+        )
+        if np.abs(a + t * d - pt).min() > tolerance:
+            return _winding_number(pt, outer) != 0
+    return False  # same boundaries
+
+
+def _is_empty(path: SvgPathLike):
+    # skip parsing and OCCT altogether for `""` and alike (eg. `<path d=""/>`)
+    return not path or (isinstance(path, str) and path.isspace())
+
+
 def path_from_SvgPathLike(path: SvgPathLike):
     if isinstance(path, Path):
         return path
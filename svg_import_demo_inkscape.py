@@ -1,7 +1,8 @@
 from collections import defaultdict
-from itertools import chain
 
-from build123d import Compound, Face, Iterable, Shape, ShapeList, Solid, Vector, Wire
+from build123d import Compound, Face, Iterable, Shape, ShapeList, Wire
+from OCP.BRepPrimAPI import BRepPrimAPI_MakePrism
+from OCP.gp import gp_Vec
 
 from svg_import import INKSCAPE_LABEL, import_svg_document
 
@@ -25,8 +26,11 @@ def collect_by_label(shapes: Iterable[Shape]):
 
 
 def extrude(faces: Iterable[Face], d: float):
-    v = Vector(0, 0, d)
-    return Compound.make_compound(Solid.extrude_linear(face, v) for face in faces)
+    # extrude all the faces at once, the prism of a compound of faces is a compound of solids
+    prism = BRepPrimAPI_MakePrism(
+        Compound.make_compound(faces).wrapped, gp_Vec(0, 0, d)
+    )
+    return Shape.cast(prism.Shape())
 
 
 faces, _wires = collect_by_label(
@@ -35,7 +39,7 @@ faces, _wires = collect_by_label(
 
 face = extrude(faces.pop("face"), 3).translate((0, 0, 6))
 head = extrude(faces.pop("head"), 8)
-body = extrude(chain.from_iterable(faces.values()), 5)
+body = extrude([f for label_faces in faces.values() for f in label_faces], 5)
 robot = head.cut(face).fuse(body)
 
 _show_object(robot)
@@ -4,8 +4,10 @@ import tempfile
 import unittest
 from io import StringIO
 
+from build123d.geometry import Location
 from build123d.topology import Face, Shape, Wire
 from svg_import import (
+    _cached_shapes_from_svg_path,
     edges_from_svg_path,
     faces_from_svg_path,
     import_svg_document,
@@ -83,6 +85,32 @@ class TestSvgImport(unittest.TestCase):
         imported = list(import_svg_document(svg))
         self.assertEqual([type(o) for o in imported], [Face, Face])
 
+    def test_non_path_shapes_closed_exactly(self):
+        svg = StringIO(
+            """<svg>
+                <circle cx="4" cy="5" r="6"/>
+                <ellipse cx="1" cy="2" rx="3" ry="1"/>
+                <rect x="0" y="0" width="4" height="3" rx="1"/>
+            </svg>"""
+        )
+        imported = list(import_svg_document(svg))
+        self.assertEqual([len(face.edges()) for face in imported], [4, 4, 8])
+        self.assertAlmostEqual(imported[0].area, 36 * pi)
+        self.assertAlmostEqual(imported[1].area, 3 * pi)
+        self.assertAlmostEqual(imported[2].area, 8 + pi)
+
+    def test_doc_degenerate_arcs(self):
+        """zero radius arcs are straight lines and zero length arcs are omitted"""
+        for d in (
+            "M 0,0 A 0,0 0 0,1 1,1 L 0,1 Z",
+            "M 0,0 A 0,5 0 0,1 1,1 L 0,1 Z",
+            "M 0,0 A 5,5 0 0,1 0,0 L 1,1 L 0,1 Z",
+        ):
+            svg = StringIO(f'<svg><path d="{d}"/></svg>')
+            imported = list(import_svg_document(svg))
+            self.assertEqual(len(imported), 1)
+            self.assertAlmostEqual(imported[0].area, 0.5)
+
     def test_doc_file_file_error(self):
         with self.assertRaises(IOError):
             assert len(list(import_svg_document("not/an/existing/file"))) == 1
@@ -135,6 +163,31 @@ class TestSvgImport(unittest.TestCase):
         self.assertFalse(list(wires_from_svg_path("")))
         self.assertFalse(list(faces_from_svg_path("")))
 
+    def test_path_string_cache_returns_copies(self):
+        for convert in (faces_from_svg_path, wires_from_svg_path):
+            (a,) = convert("M 0,0 v 1 h 1 z")
+            (b,) = convert("M 0,0 v 1 h 1 z")
+            self.assertFalse(a.wrapped.IsSame(b.wrapped))
+
+            center = b.center()
+            a.move(Location((5, 0, 0)))
+            self.assertAlmostEqual((b.center() - center).length, 0)
+            self.assertAlmostEqual((a.center() - center).length, 5)
+
+    def test_doc_repeated_paths_use_cache(self):
+        svg = StringIO(
+            """<svg>
+                <path d="M 0,0 v 1 h 1 z"/>
+                <path d="M 0,0 v 1 h 1 z"/>
+            </svg>"""
+        )
+        hits = _cached_shapes_from_svg_path.cache_info().hits
+        a, b = import_svg_document(svg)
+        self.assertEqual(_cached_shapes_from_svg_path.cache_info().hits, hits + 1)
+        self.assertFalse(a.wrapped.IsSame(b.wrapped))
+        self.assertAlmostEqual(a.area, 0.5)
+        self.assertAlmostEqual(b.area, 0.5)
+
     def test_simple_path_to_face(self):
         res = list(faces_from_svg_path("M 0,0 v 1 h 1 z"))
         assert len(res) == 1
@@ -219,13 +272,38 @@ class TestSvgImport(unittest.TestCase):
         expected_hole_counts = [0, 0, 1, 2]
         self.assertEqual(self.hole_counts(res), expected_hole_counts)
 
+    def test_path_nesting_touching_side(self):
+        res = list(faces_from_svg_path("M0,0 H10 V10 H0 Z M0,2 H4 V6 H0 Z"))
+        self.assertEqual(self.hole_counts(res), [1])
+        self.assertAlmostEqual(res[0].area, 84)
+
+    def test_path_nesting_touching_corner(self):
+        res = list(faces_from_svg_path("M0,0 H10 V10 H0 Z M4,4 H0 V0 H4 Z"))
+        self.assertEqual(self.hole_counts(res), [1])
+        self.assertAlmostEqual(res[0].area, 84)
+
+    def test_path_nesting_touching_along_edges(self):
+        outer = "M0,0 H20 V20 H0 Z"
+        child = "M1,15 H15 V20 H1 Z"
+        grandchild = "M1,18 H10 V20 H1 Z"
+        for path in (outer + child + grandchild, grandchild + child + outer):
+            res = list(faces_from_svg_path(path))
+            self.assertEqual(self.hole_counts(res), [0, 1])
+            self.assertAlmostEqual(sum(face.area for face in res), 348)
+
+    def test_path_nesting_inscribed_circle(self):
+        square = "M -5,-5 H 5 V 5 H -5 Z"
+        circle = "M -5,0 A 5,5 0 1,0 5,0 A 5,5 0 1,0 -5,0 Z"
+        for path in (square + circle, circle + square):
+            res = list(faces_from_svg_path(path))
+            self.assertEqual(self.hole_counts(res), [1])
+            self.assertAlmostEqual(res[0].area, 100 - 25 * pi, 5)
+
     @staticmethod
     def nested_squares_path(count: int, x: float = 0, y: float = 0):
-        def parts():
-            for s in range(1, count + 1):
-                yield f"M{x-s},{y-s} H{x+s} V{y+s} H{x-s} Z"
-
-        return " ".join(parts())
+        return " ".join(
+            f"M{x-s},{y-s} H{x+s} V{y+s} H{x-s} Z" for s in range(1, count + 1)
+        )
 
     @staticmethod
     def hole_counts(maybe_faces: list[Shape]):